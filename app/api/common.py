@@ -1,10 +1,46 @@
+import asyncio
 import json
-from typing import ClassVar
+from typing import Any, ClassVar, TypedDict
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from starlette import status
-from starlette.responses import JSONResponse, StreamingResponse
+from starlette.responses import Response, StreamingResponse
+
+
+class ORJSONResponse(Response):
+    """
+        基于orjson的JSON响应，直接序列化dict，跳过jsonable_encoder
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # orjson无法处理的类型（如pydantic模型）才回退到jsonable_encoder
+        return orjson.dumps(content, default=jsonable_encoder,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+# 错误stream流内容固定不变，导入时预先编码为bytes
+_ERROR_STREAM_CHUNKS = (
+    b"data: " + json.dumps(
+        {"choices": [{"delta": {"role": "assistant", "content": "当前操作无法完成，请稍后再试"}}]},
+        ensure_ascii=False).encode() + b"\n\n",  # 错误消息
+    b"data: [DONE]\n\n"
+)
+
+
+# coalesce_stream_gen中表示源stream结束的标记
+_STREAM_END = object()
+
+
+class ResponsePayload(TypedDict):
+    """
+        success/error实际返回的响应结构，仅用于类型检查，无运行时校验开销
+    """
+    code: int
+    message: str
+    data: dict
 
 
 class ErrorAPIResponse(BaseModel):
@@ -30,10 +66,12 @@ class StreamAPIResponse(BaseModel):
         stream流式响应内容
     """
 
-    HEADERS: ClassVar[dict] = {
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive"
-    }
+    # 预先编码的响应头，直接追加到raw_headers，跳过Starlette的逐个规范化
+    HEADERS: ClassVar[list[tuple[bytes, bytes]]] = [
+        (b"cache-control", b"no-cache"),
+        (b"connection", b"keep-alive"),
+        (b"x-accel-buffering", b"no")  # 禁止nginx缓冲SSE
+    ]
     MEDIA_TYPE: ClassVar[str] = "text/event-stream"
 
     @staticmethod
@@ -41,15 +79,88 @@ class StreamAPIResponse(BaseModel):
         """
             错误stream流返回信息
         """
-        error_message = {
-            "choices": [{"delta": {"role": "assistant", "content": "当前操作无法完成，请稍后再试"}}]}
-        chunks = [
-            f"data: {json.dumps(error_message, ensure_ascii=False)}\n\n",  # 错误消息
-            "data: [DONE]\n\n"
-        ]
-        for chunk in chunks:
+        for chunk in _ERROR_STREAM_CHUNKS:
             yield chunk
 
+    @staticmethod
+    async def iterate_sync_gen(stream_gen, blocking: bool = True):
+        """
+            将同步迭代器适配为异步生成器
+            默认每个chunk在线程中获取，避免阻塞事件循环；
+            仅当确定迭代过程不含阻塞IO（如内存中的列表）时才可传入blocking=False
+        """
+        if not blocking:
+            for chunk in stream_gen:
+                yield chunk
+            return
+        iterator = iter(stream_gen)
+        sentinel = object()
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, sentinel)
+            if chunk is sentinel:
+                break
+            yield chunk
+
+    @staticmethod
+    async def coalesce_stream_gen(stream_gen, max_bytes: int = 8192, max_delay: float = 0.02):
+        """
+            合并零碎的stream chunk，减少ASGI send调用次数
+            缓冲达到max_bytes、首个缓冲chunk等待超过max_delay秒或遇到[DONE]时立即输出
+            stream_gen始终在同一个后台任务中迭代，其contextvar及跨yield的取消作用域保持有效
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=64)
+
+        async def pump():
+            try:
+                async for item in stream_gen:
+                    await queue.put(item)
+            except Exception as exc:
+                # chunk只会是str或bytes，异常对象可直接作为出错标记
+                await queue.put(exc)
+            else:
+                await queue.put(_STREAM_END)
+
+        pump_task = loop.create_task(pump())
+        getter = None
+        buffer = bytearray()
+        deadline = 0.0
+        try:
+            while True:
+                if getter is None:
+                    getter = loop.create_task(queue.get())
+                timeout = max(deadline - loop.time(), 0) if buffer else None
+                done, _ = await asyncio.wait((getter,), timeout=timeout)
+                if not done:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    continue
+                chunk, getter = getter.result(), None
+                if chunk is _STREAM_END:
+                    break
+                if isinstance(chunk, Exception):
+                    if buffer:
+                        yield bytes(buffer)
+                        buffer.clear()
+                    raise chunk
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                if not buffer:
+                    deadline = loop.time() + max_delay
+                buffer += chunk
+                if len(buffer) >= max_bytes or b"[DONE]" in chunk:
+                    yield bytes(buffer)
+                    buffer.clear()
+            if buffer:
+                yield bytes(buffer)
+        finally:
+            if getter is not None:
+                getter.cancel()
+            pump_task.cancel()
+            await asyncio.gather(pump_task, return_exceptions=True)
+            if hasattr(stream_gen, "aclose"):
+                await stream_gen.aclose()
+
 
 class BaseAPI(object):
     """
@@ -58,22 +169,38 @@ class BaseAPI(object):
 
     @staticmethod
     def success(data: any, message: str = "success", code: int = 200, status_code: int = status.HTTP_200_OK):
-        response_data = SuccessAPIResponse(code=code, message=message, data=data)
-        return JSONResponse(content=jsonable_encoder(response_data), status_code=status_code)
+        # 结构与SuccessAPIResponse一致，模型仅用于OpenAPI文档
+        payload: ResponsePayload = {"code": code, "message": message, "data": data}
+        return ORJSONResponse(payload, status_code=status_code)
 
     @staticmethod
     def error(code: int, message: str, status_code: int, data: dict = None):
         if data is None:
             data = {}
-        response_data = ErrorAPIResponse(code=code, message=message, data=data)
-        return JSONResponse(content=jsonable_encoder(response_data), status_code=status_code)
+        # 结构与ErrorAPIResponse一致，模型仅用于OpenAPI文档
+        payload: ResponsePayload = {"code": code, "message": message, "data": data}
+        return ORJSONResponse(payload, status_code=status_code)
 
     @staticmethod
-    def success_stream_response(stream_gen, **kwargs):
-        return StreamingResponse(stream_gen, media_type=StreamAPIResponse.MEDIA_TYPE,
-                                 headers=StreamAPIResponse.HEADERS, **kwargs)
+    def success_stream_response(stream_gen, blocking: bool = True, coalesce: bool = True, **kwargs):
+        """
+            stream_gen应为异步生成器，在事件循环上直接迭代；
+            传入同步迭代器（如同步OpenAI客户端的stream）时默认逐个chunk在线程中获取，
+            开销与Starlette的线程池迭代相同，性能上没有收益，需要高吞吐时应改为异步生成器；
+            仅当确定其不含阻塞IO时才可传入blocking=False在事件循环上直接迭代
+            coalesce为True时合并零碎chunk后再发送
+        """
+        if not hasattr(stream_gen, "__aiter__"):
+            stream_gen = StreamAPIResponse.iterate_sync_gen(stream_gen, blocking=blocking)
+        if coalesce:
+            stream_gen = StreamAPIResponse.coalesce_stream_gen(stream_gen)
+        response = StreamingResponse(stream_gen, media_type=StreamAPIResponse.MEDIA_TYPE, **kwargs)
+        response.raw_headers.extend(StreamAPIResponse.HEADERS)
+        return response
 
     @staticmethod
     def error_stream_response(**kwargs):
-        return StreamingResponse(StreamAPIResponse.error_stream_gen(), media_type=StreamAPIResponse.MEDIA_TYPE,
-                                 headers=StreamAPIResponse.HEADERS, **kwargs)
\ No newline at end of file
+        response = StreamingResponse(StreamAPIResponse.error_stream_gen(), media_type=StreamAPIResponse.MEDIA_TYPE,
+                                     **kwargs)
+        response.raw_headers.extend(StreamAPIResponse.HEADERS)
+        return response
\ No newline at end of file
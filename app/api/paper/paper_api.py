@@ -2,7 +2,7 @@ from celery.result import AsyncResult
 from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
 from starlette import status
 
-from app.api.common import BaseAPI
+from app.api.common import BaseAPI, ORJSONResponse, SuccessAPIResponse
 from app.core.celery import celery_app
 from main import main
 from app.task.paper_assistant import paper_assistant
@@ -18,7 +18,9 @@ class RAGAPI(BaseAPI):
     @staticmethod
     @router.post("/generate_paper",
                  summary="生成论文",
-                 description="生成论文"
+                 description="生成论文",
+                 response_model=SuccessAPIResponse,
+                 response_class=ORJSONResponse
                  )
     async def generate_paper(Keyword: str):
         """
@@ -45,7 +47,9 @@ class RAGAPI(BaseAPI):
     @staticmethod
     @router.post("/get_status",
                  summary="获取结果",
-                 description="获取结果"
+                 description="获取结果",
+                 response_model=SuccessAPIResponse,
+                 response_class=ORJSONResponse
                  )
     async def generate_paper(task_id: str):
         """
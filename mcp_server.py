@@ -8,8 +8,22 @@ AstroInsight MCP Server
 import os
 import sys
 import json
+import time
+import codecs
+import queue
+import atexit
+import shutil
 import logging
+import logging.handlers
 import asyncio
+import hashlib
+import tempfile
+import threading
+import itertools
+import concurrent.futures
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -20,6 +34,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from suppress_warnings import apply_warning_filters
 apply_warning_filters()
 
+from cachetools import TTLCache
+
 try:
     from fastmcp import FastMCP
 except ImportError:
@@ -40,62 +56,209 @@ from app.utils.llm_api import call_with_deepseek, call_with_qwenmax
 from app.core.config import OUTPUT_PATH
 from app.task.paper_assistant import paper_assistant
 
-# 配置日志
+# 配置日志：工具调用只把日志记录放入队列，由后台QueueListener线程写文件和stderr
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('mcp_server.log')
+_stream_handler = logging.StreamHandler(sys.stderr)  # 使用stderr避免与stdio传输冲突
+for _handler in (_file_handler, _stream_handler):
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, _stream_handler,
+                                               respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# QueueHandler.prepare()会先格式化消息，这里只保留原始消息，完整格式由listener的handler负责
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('mcp_server.log'),
-        logging.StreamHandler(sys.stderr)  # 使用stderr避免与stdio传输冲突
-    ]
+    handlers=[_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
 # 创建FastMCP实例
 mcp = FastMCP("AstroInsight")
 
+@dataclass(slots=True)
+class Task:
+    """任务信息，时间戳以time.time()浮点数存储"""
+    id: str
+    type: str
+    status: str
+    params: Dict[str, Any]
+    created_at: float
+    updated_at: float
+    result: Any = None
+    error: Optional[str] = None
+    progress: int = 0
+
+
+@dataclass(slots=True)
+class SpilledResult:
+    """写入磁盘的大任务结果，内存中只保留文件路径、字节数及是否为JSON"""
+    path: str
+    size: int
+    is_json: bool
+
+
+# 任务结果超过该字节数时写入OUTPUT_PATH下的文件，不常驻内存
+RESULT_SPILL_THRESHOLD = 64 * 1024
+# get_task_result每次读取的默认及最大字节数
+RESULT_CHUNK_SIZE = 64 * 1024
+MAX_RESULT_CHUNK_SIZE = RESULT_CHUNK_SIZE * 16
+# 每个服务器进程使用OUTPUT_PATH下独立的结果目录，首次写入时创建，避免多个stdio进程互相清理
+_task_result_dir: Optional[str] = None
+_task_result_dir_lock = threading.Lock()
+
+
+def _get_task_result_dir() -> str:
+    """获取本进程的任务结果目录，不存在时创建"""
+    global _task_result_dir
+    with _task_result_dir_lock:
+        if _task_result_dir is None:
+            os.makedirs(OUTPUT_PATH, exist_ok=True)
+            _task_result_dir = tempfile.mkdtemp(prefix="task_results_", dir=OUTPUT_PATH)
+        return _task_result_dir
+
+
+def _serialize_result(result: Any) -> tuple[bytes, bool]:
+    """将任务结果编码为UTF-8字节，字符串原样编码，其他类型序列化为JSON；返回字节及是否为JSON"""
+    if isinstance(result, str):
+        return result.encode("utf-8"), False
+    return json.dumps(result, ensure_ascii=False, default=str).encode("utf-8"), True
+
+
+def _spill_large_result(task_id: str, result: Any) -> Any:
+    """结果过大时写入文件并返回SpilledResult，否则原样返回"""
+    if result is None:
+        return result
+    data, is_json = _serialize_result(result)
+    if len(data) <= RESULT_SPILL_THRESHOLD:
+        return result
+    path = os.path.join(_get_task_result_dir(), f"{task_id}.json" if is_json else f"{task_id}.txt")
+    with open(path, "wb") as f:
+        f.write(data)
+    return SpilledResult(path=path, size=len(data), is_json=is_json)
+
+
+def _remove_spilled_result(result: Any):
+    """删除SpilledResult对应的文件"""
+    if isinstance(result, SpilledResult):
+        with suppress(OSError):
+            os.remove(result.path)
+
+
+def _clear_task_results():
+    """删除本进程创建的任务结果目录，不影响其他进程的结果文件"""
+    global _task_result_dir
+    with _task_result_dir_lock:
+        if _task_result_dir is not None:
+            shutil.rmtree(_task_result_dir, ignore_errors=True)
+            _task_result_dir = None
+
+
+def _decode_result_chunk(chunk: bytes, offset: int, size: int) -> tuple[str, int]:
+    """解码从offset开始的chunk，按UTF-8字符边界截断，返回文本及下一次读取的offset"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    text = decoder.decode(chunk, final=offset + len(chunk) >= size)
+    return text, offset + len(chunk) - len(decoder.getstate()[0])
+
+
+def _read_spilled_result(spilled: SpilledResult, offset: int, length: int) -> tuple[str, int]:
+    """从文件offset开始读取最多length字节，返回文本及下一次读取的offset"""
+    with open(spilled.path, "rb") as f:
+        f.seek(offset)
+        chunk = f.read(length)
+    return _decode_result_chunk(chunk, offset, spilled.size)
+
+
 class TaskManager:
     """任务管理器，用于管理异步任务"""
     
-    def __init__(self):
-        self.tasks = {}
+    def __init__(self, max_history: int = 1024):
+        self.tasks: Dict[str, Task] = {}
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+        # 只保留最近max_history个任务，避免长期运行时内存无限增长
+        self._order = deque(maxlen=max_history)
+        # 持有后台任务的强引用，防止事件循环只持有弱引用时任务被垃圾回收
+        self._pending: set[asyncio.Task] = set()
     
-    def create_task(self, task_type: str, params: Dict[str, Any]) -> str:
+    async def create_task(self, task_type: str, params: Dict[str, Any]) -> str:
         """创建新任务"""
-        task_id = f"task_{len(self.tasks) + 1}_{int(datetime.now().timestamp())}"
-        self.tasks[task_id] = {
-            "id": task_id,
-            "type": task_type,
-            "status": "pending",
-            "params": params,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "result": None,
-            "error": None,
-            "progress": 0
-        }
+        task_id = f"task_{next(self._ids)}_{time.time_ns()}"
+        now = time.time()
+        async with self._lock:
+            if len(self._order) == self._order.maxlen:
+                evicted = self.tasks.pop(self._order[0], None)
+                if evicted is not None:
+                    _remove_spilled_result(evicted.result)
+            self._order.append(task_id)
+            self.tasks[task_id] = Task(
+                id=task_id,
+                type=task_type,
+                status="pending",
+                params=params,
+                created_at=now,
+                updated_at=now
+            )
         return task_id
     
-    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+    def run_in_background(self, coro) -> asyncio.Task:
+        """在当前事件循环中启动后台协程，并保留引用直到其完成"""
+        background_task = asyncio.get_running_loop().create_task(coro)
+        self._pending.add(background_task)
+        background_task.add_done_callback(self._pending.discard)
+        return background_task
+    
+    def get_task(self, task_id: str) -> Optional[Task]:
         """获取任务信息"""
         return self.tasks.get(task_id)
     
-    def update_task(self, task_id: str, status: str, result: Any = None, error: str = None):
-        """更新任务状态"""
-        if task_id in self.tasks:
-            self.tasks[task_id].update({
-                "status": status,
-                "updated_at": datetime.now().isoformat(),
-                "result": result,
-                "error": error,
-                "progress": 100 if status == "completed" else 50 if status == "running" else 0
-            })
+    async def update_task(self, task_id: str, status: str, result: Any = None, error: str = None):
+        """更新任务状态，过大的结果写入文件后只保存SpilledResult"""
+        if result is not None:
+            # 任务已被淘汰时不再写文件
+            async with self._lock:
+                if task_id not in self.tasks:
+                    return
+            result = await asyncio.to_thread(_spill_large_result, task_id, result)
+        async with self._lock:
+            task = self.tasks.get(task_id)
+            if task is None:
+                # 写文件期间任务被淘汰，删除已写入的文件
+                _remove_spilled_result(result)
+            else:
+                task.status = status
+                task.updated_at = time.time()
+                task.result = result
+                task.error = error
+                task.progress = 100 if status == "completed" else 50 if status == "running" else 0
 
 # 全局任务管理器
 task_manager = TaskManager()
 
+# 研究想法生成专用线程池，限制并发生成数量，避免占满默认线程池影响其他工具
+MAX_IDEA_WORKERS = 4
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_IDEA_WORKERS, thread_name_prefix="astro")
+_IDEA_SEMAPHORE = asyncio.Semaphore(MAX_IDEA_WORKERS)
+
+# 论文搜索与关键词提取结果缓存，相同输入在有效期内不重复请求上游
+_SEARCH_CACHE = TTLCache(maxsize=512, ttl=3600)
+_KEYWORDS_CACHE = TTLCache(maxsize=512, ttl=3600)
+
+# search_papers返回的论文字段及缺省值
+_PAPER_FIELDS = (
+    ("title", ""),
+    ("authors", ()),
+    ("abstract", ""),
+    ("published", ""),
+    ("url", ""),
+    ("pdf_url", "")
+)
+
 @mcp.tool
-def search_papers(keyword: str, limit: int = 5) -> Dict[str, Any]:
+async def search_papers(keyword: str, limit: int = 5) -> Dict[str, Any]:
     """
     搜索学术论文
     
@@ -107,10 +270,15 @@ def search_papers(keyword: str, limit: int = 5) -> Dict[str, Any]:
         包含论文列表的字典
     """
     try:
-        logger.info(f"搜索论文，关键词: {keyword}, 限制: {limit}")
+        logger.info("搜索论文，关键词: %s, 限制: %d", keyword, limit)
         
         # 调用arxiv搜索
-        papers = search_paper(keyword, limit)
+        cache_key = (keyword, limit)
+        papers = _SEARCH_CACHE.get(cache_key)
+        if papers is None:
+            papers = await asyncio.to_thread(search_paper, keyword, limit)
+            if papers:
+                _SEARCH_CACHE[cache_key] = papers
         
         if not papers:
             return {
@@ -120,19 +288,9 @@ def search_papers(keyword: str, limit: int = 5) -> Dict[str, Any]:
             }
         
         # 格式化论文信息
-        formatted_papers = []
-        for paper in papers:
-            formatted_paper = {
-                "title": paper.get("title", ""),
-                "authors": paper.get("authors", []),
-                "abstract": paper.get("abstract", ""),
-                "published": paper.get("published", ""),
-                "url": paper.get("url", ""),
-                "pdf_url": paper.get("pdf_url", "")
-            }
-            formatted_papers.append(formatted_paper)
+        formatted_papers = [{key: paper.get(key, default) for key, default in _PAPER_FIELDS} for paper in papers]
         
-        logger.info(f"成功搜索到 {len(formatted_papers)} 篇论文")
+        logger.info("成功搜索到 %d 篇论文", len(formatted_papers))
         return {
             "success": True,
             "message": f"成功搜索到 {len(formatted_papers)} 篇论文",
@@ -140,7 +298,7 @@ def search_papers(keyword: str, limit: int = 5) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"搜索论文时出错: {str(e)}")
+        logger.error("搜索论文时出错: %s", e)
         return {
             "success": False,
             "message": f"搜索论文时出错: {str(e)}",
@@ -148,7 +306,7 @@ def search_papers(keyword: str, limit: int = 5) -> Dict[str, Any]:
         }
 
 @mcp.tool
-def extract_keywords(text: str, split_section: str = "Paper Abstract") -> Dict[str, Any]:
+async def extract_keywords(text: str, split_section: str = "Paper Abstract") -> Dict[str, Any]:
     """
     从文本中提取技术关键词
     
@@ -160,10 +318,15 @@ def extract_keywords(text: str, split_section: str = "Paper Abstract") -> Dict[s
         包含提取的关键词列表的字典
     """
     try:
-        logger.info(f"提取关键词，文本长度: {len(text)}")
+        logger.info("提取关键词，文本长度: %d", len(text))
         
-        # 调用关键词提取函数
-        keywords = extract_technical_entities(text, split_section)
+        # 调用关键词提取函数，以文本摘要作为缓存键避免保存长文本
+        cache_key = (hashlib.blake2b(text.encode("utf-8")).hexdigest(), split_section)
+        keywords = _KEYWORDS_CACHE.get(cache_key)
+        if keywords is None:
+            keywords = await asyncio.to_thread(extract_technical_entities, text, split_section)
+            if keywords:
+                _KEYWORDS_CACHE[cache_key] = keywords
         
         if not keywords:
             return {
@@ -172,7 +335,7 @@ def extract_keywords(text: str, split_section: str = "Paper Abstract") -> Dict[s
                 "keywords": []
             }
         
-        logger.info(f"成功提取到 {len(keywords)} 个关键词")
+        logger.info("成功提取到 %d 个关键词", len(keywords))
         return {
             "success": True,
             "message": f"成功提取到 {len(keywords)} 个关键词",
@@ -180,7 +343,7 @@ def extract_keywords(text: str, split_section: str = "Paper Abstract") -> Dict[s
         }
         
     except Exception as e:
-        logger.error(f"提取关键词时出错: {str(e)}")
+        logger.error("提取关键词时出错: %s", e)
         return {
             "success": False,
             "message": f"提取关键词时出错: {str(e)}",
@@ -188,7 +351,7 @@ def extract_keywords(text: str, split_section: str = "Paper Abstract") -> Dict[s
         }
 
 @mcp.tool
-def generate_research_idea(keyword: str, paper_count: int = 3) -> Dict[str, Any]:
+async def generate_research_idea(keyword: str, paper_count: int = 3) -> Dict[str, Any]:
     """
     生成研究想法（异步任务）
     
@@ -200,16 +363,16 @@ def generate_research_idea(keyword: str, paper_count: int = 3) -> Dict[str, Any]
         包含任务ID的字典，可用于查询任务状态
     """
     try:
-        logger.info(f"创建研究想法生成任务，关键词: {keyword}, 论文数量: {paper_count}")
+        logger.info("创建研究想法生成任务，关键词: %s, 论文数量: %d", keyword, paper_count)
         
         # 创建异步任务
-        task_id = task_manager.create_task("generate_research_idea", {
+        task_id = await task_manager.create_task("generate_research_idea", {
             "keyword": keyword,
             "paper_count": paper_count
         })
         
         # 启动异步任务
-        asyncio.create_task(_generate_research_idea_async(task_id, keyword, paper_count))
+        task_manager.run_in_background(_generate_research_idea_async(task_id, keyword, paper_count))
         
         return {
             "success": True,
@@ -218,7 +381,7 @@ def generate_research_idea(keyword: str, paper_count: int = 3) -> Dict[str, Any]
         }
         
     except Exception as e:
-        logger.error(f"创建研究想法生成任务时出错: {str(e)}")
+        logger.error("创建研究想法生成任务时出错: %s", e)
         return {
             "success": False,
             "message": f"创建任务时出错: {str(e)}",
@@ -228,21 +391,22 @@ def generate_research_idea(keyword: str, paper_count: int = 3) -> Dict[str, Any]
 async def _generate_research_idea_async(task_id: str, keyword: str, paper_count: int):
     """异步生成研究想法"""
     try:
-        task_manager.update_task(task_id, "running")
-        logger.info(f"开始执行研究想法生成任务: {task_id}")
+        await task_manager.update_task(task_id, "running")
+        logger.info("开始执行研究想法生成任务: %s", task_id)
         
         # 调用主程序生成研究想法
-        result = await asyncio.get_event_loop().run_in_executor(
-            None, astro_main, keyword, paper_count
-        )
+        async with _IDEA_SEMAPHORE:
+            result = await asyncio.get_running_loop().run_in_executor(
+                _EXECUTOR, astro_main, keyword, paper_count
+            )
         
-        task_manager.update_task(task_id, "completed", result)
-        logger.info(f"研究想法生成任务完成: {task_id}")
+        await task_manager.update_task(task_id, "completed", result)
+        logger.info("研究想法生成任务完成: %s", task_id)
         
     except Exception as e:
         error_msg = f"生成研究想法时出错: {str(e)}"
-        task_manager.update_task(task_id, "failed", error=error_msg)
-        logger.error(f"任务 {task_id} 失败: {error_msg}")
+        await task_manager.update_task(task_id, "failed", error=error_msg)
+        logger.error("任务 %s 失败: %s", task_id, error_msg)
 
 @mcp.tool
 def get_task_status(task_id: str) -> Dict[str, Any]:
@@ -269,18 +433,18 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
             "success": True,
             "message": "任务状态获取成功",
             "task": {
-                "id": task["id"],
-                "type": task["type"],
-                "status": task["status"],
-                "progress": task["progress"],
-                "created_at": task["created_at"],
-                "updated_at": task["updated_at"],
-                "error": task["error"]
+                "id": task.id,
+                "type": task.type,
+                "status": task.status,
+                "progress": task.progress,
+                "created_at": datetime.fromtimestamp(task.created_at).isoformat(),
+                "updated_at": datetime.fromtimestamp(task.updated_at).isoformat(),
+                "error": task.error
             }
         }
         
     except Exception as e:
-        logger.error(f"获取任务状态时出错: {str(e)}")
+        logger.error("获取任务状态时出错: %s", e)
         return {
             "success": False,
             "message": f"获取任务状态时出错: {str(e)}",
@@ -288,7 +452,69 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
         }
 
 @mcp.tool
-def review_research_idea(topic: str, draft: str) -> Dict[str, Any]:
+async def get_task_result(task_id: str, offset: int = 0, length: int = RESULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    获取已完成任务的结果，按offset分段读取
+    
+    结果统一以UTF-8文本分段返回：字符串结果为原文，其他类型为JSON序列化后的文本。
+    拼接全部分段后，is_json为True时需再做JSON解析。
+    
+    Args:
+        task_id: 任务ID
+        offset: 读取起始字节位置，首次为0，之后使用上次返回的next_offset
+        length: 本次最多读取的字节数，默认64KB，最大1MB
+    
+    Returns:
+        包含任务结果的字典：result为本段文本，is_json表示完整结果是否为JSON，
+        size为结果总字节数，next_offset为下一次读取位置，done为True表示结果已读取完毕
+    """
+    try:
+        task = task_manager.get_task(task_id)
+        
+        if not task:
+            return {
+                "success": False,
+                "message": f"未找到任务: {task_id}",
+                "result": None
+            }
+        
+        if task.status != "completed":
+            return {
+                "success": False,
+                "message": f"任务尚未完成，当前状态: {task.status}",
+                "result": None
+            }
+        
+        offset = max(offset, 0)
+        length = min(max(length, 4), MAX_RESULT_CHUNK_SIZE)
+        if isinstance(task.result, SpilledResult):
+            size, is_json = task.result.size, task.result.is_json
+            content, next_offset = await asyncio.to_thread(_read_spilled_result, task.result, offset, length)
+        else:
+            data, is_json = _serialize_result(task.result)
+            size = len(data)
+            content, next_offset = _decode_result_chunk(data[offset:offset + length], offset, size)
+        
+        return {
+            "success": True,
+            "message": "任务结果获取成功",
+            "result": content,
+            "is_json": is_json,
+            "size": size,
+            "next_offset": next_offset,
+            "done": next_offset >= size
+        }
+        
+    except Exception as e:
+        logger.error("获取任务结果时出错: %s", e)
+        return {
+            "success": False,
+            "message": f"获取任务结果时出错: {str(e)}",
+            "result": None
+        }
+
+@mcp.tool
+async def review_research_idea(topic: str, draft: str) -> Dict[str, Any]:
     """
     评审研究想法
     
@@ -300,10 +526,10 @@ def review_research_idea(topic: str, draft: str) -> Dict[str, Any]:
         包含评审结果的字典
     """
     try:
-        logger.info(f"评审研究想法，主题: {topic}")
+        logger.info("评审研究想法，主题: %s", topic)
         
         # 调用评审机制
-        review_result = review_mechanism(topic, draft)
+        review_result = await asyncio.to_thread(review_mechanism, topic, draft)
         
         if not review_result:
             return {
@@ -319,7 +545,7 @@ def review_research_idea(topic: str, draft: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"评审研究想法时出错: {str(e)}")
+        logger.error("评审研究想法时出错: %s", e)
         return {
             "success": False,
             "message": f"评审时出错: {str(e)}",
@@ -327,7 +553,7 @@ def review_research_idea(topic: str, draft: str) -> Dict[str, Any]:
         }
 
 @mcp.tool
-def compress_paper_content(title: str, abstract: str, content: str = "") -> Dict[str, Any]:
+async def compress_paper_content(title: str, abstract: str, content: str = "") -> Dict[str, Any]:
     """
     压缩论文内容
     
@@ -340,10 +566,10 @@ def compress_paper_content(title: str, abstract: str, content: str = "") -> Dict
         包含压缩结果的字典
     """
     try:
-        logger.info(f"压缩论文内容，标题: {title[:50]}...")
+        logger.info("压缩论文内容，标题: %s...", title[:50])
         
         # 调用论文压缩函数
-        compressed_result = paper_compression(title, abstract, content)
+        compressed_result = await asyncio.to_thread(paper_compression, title, abstract, content)
         
         if not compressed_result:
             return {
@@ -359,13 +585,31 @@ def compress_paper_content(title: str, abstract: str, content: str = "") -> Dict
         }
         
     except Exception as e:
-        logger.error(f"压缩论文内容时出错: {str(e)}")
+        logger.error("压缩论文内容时出错: %s", e)
         return {
             "success": False,
             "message": f"压缩时出错: {str(e)}",
             "compressed_content": None
         }
 
+# 服务器信息固定不变，模块加载时构建一次
+_SERVER_INFO = {
+    "name": "AstroInsight MCP Server",
+    "version": "1.0.0",
+    "description": "学术论文研究助手的MCP服务器",
+    "tools": [
+        "search_papers",
+        "extract_keywords", 
+        "generate_research_idea",
+        "get_task_status",
+        "get_task_result",
+        "review_research_idea",
+        "compress_paper_content",
+        "get_server_info"
+    ],
+    "status": "running"
+}
+
 @mcp.tool
 def get_server_info() -> Dict[str, Any]:
     """
@@ -374,23 +618,19 @@ def get_server_info() -> Dict[str, Any]:
     Returns:
         包含服务器信息的字典
     """
-    return {
-        "name": "AstroInsight MCP Server",
-        "version": "1.0.0",
-        "description": "学术论文研究助手的MCP服务器",
-        "tools": [
-            "search_papers",
-            "extract_keywords", 
-            "generate_research_idea",
-            "get_task_status",
-            "review_research_idea",
-            "compress_paper_content",
-            "get_server_info"
-        ],
-        "status": "running"
-    }
+    return _SERVER_INFO
 
 if __name__ == "__main__":
     logger.info("启动AstroInsight MCP服务器")
-    # 运行MCP服务器
-    mcp.run(transport="stdio")
\ No newline at end of file
+    # Linux/macOS下使用uvloop事件循环，未安装（如Windows）时使用默认事件循环
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    try:
+        # 运行MCP服务器
+        mcp.run(transport="stdio")
+    finally:
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _clear_task_results()
\ No newline at end of file